@@ -7,3 +7,53 @@ class TestTagging(unittest.TestCase):
     def test_broadway(self):
         s1 = '1775 Broadway And 57th, Newyork NY'
         usaddress.tag(s1)
+
+    def test_intersection(self):
+        self.assertEqual(
+            usaddress.tag('Broadway & 57th St, New York NY'),
+            ({
+                'StreetName': 'Broadway',
+                'IntersectionSeparator': '&',
+                'SecondStreetName': '57th',
+                'SecondStreetNamePostType': 'St',
+                'PlaceName': 'New York',
+                'StateName': 'NY',
+            }, 'Intersection')
+        )
+        # an address number alongside the separator leaves the type ambiguous
+        self.assertEqual(
+            usaddress.tag('1775 Broadway And 57th, Newyork NY'),
+            ({
+                'AddressNumber': '1775',
+                'StreetName': 'Broadway',
+                'IntersectionSeparator': 'And',
+                'SecondStreetName': '57th',
+                'PlaceName': 'Newyork',
+                'StateName': 'NY',
+            }, 'Ambiguous')
+        )
+
+    def test_parse_labels(self):
+        self.assertEqual(
+            usaddress.parse('123 Main St.'),
+            [('123', 'AddressNumber'), ('Main', 'StreetName'), ('St.', 'StreetNamePostType')]
+        )
+        self.assertEqual(
+            usaddress.parse_many(['123 Main St.']),
+            [[('123', 'AddressNumber'), ('Main', 'StreetName'), ('St.', 'StreetNamePostType')]]
+        )
+
+    def test_many_all_empty(self):
+        self.assertEqual(usaddress.parse_many(['', ' ']), [[], []])
+        self.assertEqual(usaddress.parse_many([]), [])
+
+    def test_many_matches_single(self):
+        addresses = ['123 Main St. Suite 100 Chicago, IL', '', 'PO Box 123, Nowhere TX 75001']
+        self.assertEqual(
+            usaddress.parse_many(addresses),
+            [usaddress.parse(a) for a in addresses]
+        )
+        self.assertEqual(
+            usaddress.tag_many(addresses),
+            [usaddress.tag(a) for a in addresses]
+        )
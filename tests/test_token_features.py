@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from usaddress import tokenFeatures
+from usaddress import tokenFeatures, tokens2features
 import unittest
 
 
@@ -9,6 +9,27 @@ class TestTokenFeatures(unittest.TestCase):
         features = tokenFeatures(u'å')
         assert features['endsinpunc'] is False
 
+    def test_endsinpunc(self):
+        assert tokenFeatures('st,')['endsinpunc'] == ','
+        assert tokenFeatures('a-b')['endsinpunc'] == 'b'
+        assert tokenFeatures('st.')['endsinpunc'] is False
+        assert tokenFeatures('#')['endsinpunc'] is False
+        assert tokenFeatures('\n(wk')['endsinpunc'] is False
+
+    def test_sequences_leave_token_features_untouched(self):
+        link_keys = {'next', 'previous', 'address.start', 'address.end'}
+        tokens2features(('1', 'main', 'st'))
+        sequence = tokens2features(('main', 'st', 'chicago'))
+
+        for token in ('1', 'main', 'st', 'chicago'):
+            assert not link_keys & set(tokenFeatures(token))
+
+        for features in sequence:
+            for link in ('previous', 'next'):
+                if link in features:
+                    assert 'previous' not in features[link]
+                    assert 'next' not in features[link]
+
 
 if __name__ == '__main__':
     unittest.main()
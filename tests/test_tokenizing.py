@@ -150,6 +150,12 @@ class TestTokenizing(unittest.TestCase):
              'IL', '60654']
         )
 
+    def test_bytes(self):
+        self.assertEqual(
+            tokenize(b'1 abc st'),
+            tokenize('1 abc st')
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
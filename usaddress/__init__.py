@@ -7,8 +7,7 @@ from functools import lru_cache
 import os
 import string
 import re
-from collections import OrderedDict
-from typing import Any, Dict, Hashable, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 import warnings
 from sklearn_crfsuite.estimator import CRF
 import probableparsing
@@ -53,6 +52,9 @@ GROUP_LABEL:Final = 'AddressCollection'
 MODEL_FILE:Final = 'usaddr.crfsuite'
 MODEL_PATH:Final = os.path.join(os.path.split(os.path.abspath(__file__))[0], MODEL_FILE)
 
+# DIRECTIONS and STREET_NAMES are probed with the same token string, whose hash
+# CPython computes once and caches; a length/first-character prefilter in front
+# of the frozensets benchmarked slower than the plain lookups, so there is none.
 DIRECTIONS:Final = frozenset(['n', 's', 'e', 'w',
                     'ne', 'nw', 'se', 'sw',
                     'north', 'south', 'east', 'west',
@@ -128,15 +130,42 @@ STREET_NAMES:Final = frozenset({
 })
 # cSpell:enable
 
+VOWELS:Final = frozenset('aeiou')
+DIGITS:Final = frozenset(string.digits)
+
+# Prebuilt 'length' feature values, shared by every token of that length
+DIGIT_LENGTH_FEATURES:Final = tuple('d:' + str(i) for i in range(32))
+WORD_LENGTH_FEATURES:Final = tuple('w:' + str(i) for i in range(64))
+
+# Stay on the stdlib `re` engine here: RE2's `\b` is ASCII-only (it would split
+# tokens like 'élan'), and both RE2 and Hyperscan bindings cost more per call
+# than `findall` itself on address-length strings.
 ADDRESS_TOKEN_REGEX:Final = re.compile(r"""
 \(*\b[^\s,;#&()]+[.,;)\n]*   # ['ab. cd,ef '] -> ['ab.', 'cd,', 'ef']
 |
 [#&]                       # [^'#abc'] -> ['#']
 """,  re.VERBOSE | re.UNICODE)
 TOKEN_CLEAN_REGEX:Final = re.compile(r'(^[\W]*)|([^.\w]*$)', re.UNICODE)
+# ASCII equivalents of TOKEN_CLEAN_REGEX's two character classes, so ASCII
+# tokens can be cleaned with str.lstrip / str.rstrip
+ASCII_NON_WORD_CHARS:Final = ''.join(chr(i) for i in range(128) if not (chr(i).isalnum() or chr(i) == '_'))
+ASCII_TRAILING_CLEAN_CHARS:Final = ASCII_NON_WORD_CHARS.replace('.', '')
+AMPERSAND_ENTITY_REGEX:Final = re.compile(r'(&#38;)|(&amp;)')
+
+# Plain dict caches for the per-token hot path; once full they simply stop
+# admitting new keys, which is cheaper than lru_cache's bookkeeping on a hit.
+_TOKEN_FEATURES_CACHE:Dict[str, Dict[str, Any]] = {}
+_TOKEN_FEATURES_CACHE_SIZE:Final = 4096
+_FEATURE_SEQUENCE_CACHE:Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+_FEATURE_SEQUENCE_CACHE_SIZE:Final = 4096
+_DIGITS_CACHE:Dict[str, str] = {}
+_DIGITS_CACHE_SIZE:Final = 1024
 
 try:
     tagger = CRF(model_filename= MODEL_PATH)
+    # CRF opens the pycrfsuite tagger lazily; tag a throwaway sequence now so
+    # the model is loaded at import rather than on the first real parse
+    tagger.predict_single([{'address.start': True, 'address.end': True}])
 except IOError:
     warnings.warn(f'You must train the model (parserator train --trainfile FILES) to create the {MODEL_FILE} file before you can use the parse  and tag methods') # cSpell: disable-line
 
@@ -150,26 +179,58 @@ def parse(address_string:str) -> List[Tuple[str, str]]:
     if not tokens:
         return []
 
-    features = tokens2features(cast(Hashable, tokens))
+    features = tokens2features(tokens)
 
-    tags = tagger.predict(features)
+    tags = tagger.predict_single(features)
     return list(zip(tokens, tags))
 
 
-def tag(address_string:str, tag_mapping:Optional[Dict[str, str]]= None) -> Tuple["OrderedDict[str, str]", str]:
+def parse_many(address_strings:Iterable[str]) -> List[List[Tuple[str, str]]]:
+    """
+    Parse several address strings into lists of (part, type) tuples, handing
+    every feature sequence to the tagger in a single call.
+    """
+    token_lists = [tokenize(address_string) for address_string in address_strings]
+    features = [tokens2features(tokens) for tokens in token_lists if tokens]
+
+    tags = iter(tagger.predict(features))
+    return [list(zip(tokens, next(tags))) if tokens else [] for tokens in token_lists]
+
+
+def tag(address_string:str, tag_mapping:Optional[Dict[str, str]]= None) -> Tuple[Dict[str, str], str]:
     """
     Tag an address string into word parts
     """
-    tagged_address:OrderedDict[str, List[str]] = OrderedDict()
+    return _tagParsed(address_string, parse(address_string), tag_mapping)
+
+
+def tag_many(address_strings:Iterable[str], tag_mapping:Optional[Dict[str, str]]= None) -> List[Tuple[Dict[str, str], str]]:
+    """
+    Tag several address strings into word parts, parsing them as one batch
+    """
+    address_strings = list(address_strings)
+    return [
+        _tagParsed(address_string, parsed, tag_mapping)
+        for address_string, parsed in zip(address_strings, parse_many(address_strings))
+    ]
+
+
+def _tagParsed(address_string:str, parsed:List[Tuple[str, str]], tag_mapping:Optional[Dict[str, str]]= None) -> Tuple[Dict[str, str], str]:
+    """
+    Merge the (part, type) tuples from parsing address_string into word parts
+    """
+    tagged_address:Dict[str, str] = {}
 
-    last_label = None
+    last_label:Optional[str] = None
+    current_tokens:List[str] = []
     is_intersection = False
     og_labels:List[str] = []
 
-    for token, label in parse(address_string):
-        is_intersection = label == 'IntersectionSeparator'
+    for token, label in parsed:
+        if label == 'IntersectionSeparator':
+            is_intersection = True
         if 'StreetName' in label and is_intersection:
-            label = f'Second {label}'
+            label = f'Second{label}'
 
         # saving old label
         og_labels.append(label)
@@ -179,19 +240,20 @@ def tag(address_string:str, tag_mapping:Optional[Dict[str, str]]= None) -> Tuple
             if newMapping is not None:
                 label = newMapping
         if label == last_label:
-            tagged_address[label].append(token)
-        elif label not in tagged_address:
-            tagged_address[label] = [token]
-        else:
-            raise RepeatedLabelError(address_string, parse(address_string),  label)
-
+            current_tokens.append(token)
+            continue
+        if label in tagged_address:
+            raise RepeatedLabelError(address_string, parsed,  label)
+
+        # the previous component is complete once the label changes
+        if last_label is not None:
+            tagged_address[last_label] = ' '.join(current_tokens).strip().strip(",;")
+        current_tokens = [token]
         last_label = label
 
-    taggedAddressJoined:OrderedDict[str, str] = OrderedDict()
-    for token in tagged_address:
-        component = ' '.join(tagged_address[token])
-        component = component.strip().strip(",;")
-        taggedAddressJoined[token] = component
+    if last_label is not None:
+        tagged_address[last_label] = ' '.join(current_tokens).strip().strip(",;")
+
     # Set up the AddressType literal
     if 'AddressNumber' in og_labels and not is_intersection:
         address_type = 'Street Address'
@@ -202,91 +264,156 @@ def tag(address_string:str, tag_mapping:Optional[Dict[str, str]]= None) -> Tuple
     else:
         address_type = 'Ambiguous'
 
-    return taggedAddressJoined, address_type
+    return tagged_address, address_type
 
 
-@lru_cache(maxsize= None)
 def tokenize(address_string:Union[str, bytes]) -> List[str]:
     """
+    Split an address string into tokens.
+
+    Results are cached, so repeated addresses get back the same list object;
+    callers must treat it as read-only.
     """
     if isinstance(address_string, bytes):
         address_string = str(address_string, encoding='utf-8')
-    address_string = re.sub('(&#38;)|(&amp;)', '&', address_string)
+    return _tokenizeStr(address_string)
+
+@lru_cache(maxsize= 8192)
+def _tokenizeStr(address_string:str) -> List[str]:
+    """
+    Cached worker for tokenize; only ever sees str, so bytes and str spellings
+    of an address share one cache entry.
+    """
+    if '&' in address_string:
+        address_string = AMPERSAND_ENTITY_REGEX.sub('&', address_string)
     tokens:List[str] = ADDRESS_TOKEN_REGEX.findall(address_string)
-    if not tokens:
-        return []
     return tokens
 
-@lru_cache(maxsize= 1024)
+# keep the lru_cache introspection tokenize had when it was decorated directly
+tokenize.cache_info = _tokenizeStr.cache_info # type: ignore[attr-defined]
+tokenize.cache_clear = _tokenizeStr.cache_clear # type: ignore[attr-defined]
+
 def tokenFeatures(token:str) -> Dict[str, Any]:
     """
+    Return a fresh feature dict for a single token.
+    """
+    return _sharedTokenFeatures(token).copy()
+
+def _sharedTokenFeatures(token:str) -> Dict[str, Any]:
+    """
+    Return the cached feature dict for a token. It is shared between every
+    feature sequence that contains the token, so it must never be mutated.
     """
+    cached = _TOKEN_FEATURES_CACHE.get(token)
+    if cached is not None:
+        return cached
+
     if token in ('&', '#', '½'):
         token_clean = token
+    elif token.isascii():
+        token_clean = token.lstrip(ASCII_NON_WORD_CHARS).rstrip(ASCII_TRAILING_CLEAN_CHARS)
     else:
         token_clean = TOKEN_CLEAN_REGEX.sub('', token)
 
     token_abbrev = token_clean.lower().replace(".", "")
+    is_number = token_abbrev.isdigit()
+    length_features = DIGIT_LENGTH_FEATURES if is_number else WORD_LENGTH_FEATURES
+    if len(token_abbrev) < len(length_features):
+        length = length_features[len(token_abbrev)]
+    else:
+        length = ('d:' if is_number else 'w:') + str(len(token_abbrev))
     features = {
         'abbrev': token_clean[-1] == '.',
         'digits': digits(token_clean),
-        'word': (token_abbrev if not token_abbrev.isdigit()  else False),
-        'trailing.zeros': (trailingZeros(token_abbrev) if token_abbrev.isdigit() else False),
-        'length': ('d:' + str(len(token_abbrev)) if token_abbrev.isdigit() else 'w:' + str(len(token_abbrev))),
-        'endsinpunc': (token[-1] if bool(re.match(r'.+[^.\w]', token, flags=re.UNICODE))  else False),
+        'word': (token_abbrev if not is_number else False),
+        'trailing.zeros': (trailingZeros(token_abbrev) if is_number else False),
+        'length': length,
+        'endsinpunc': (token[-1] if hasPuncAfterFirst(token) else False),
         'directional': token_abbrev in DIRECTIONS,
         'street_name': token_abbrev in STREET_NAMES,
-        'has.vowels': bool(set(token_abbrev[1:]) & set('aeiou')),
+        'has.vowels': not VOWELS.isdisjoint(token_abbrev[1:]),
     }
 
+    if len(_TOKEN_FEATURES_CACHE) < _TOKEN_FEATURES_CACHE_SIZE:
+        _TOKEN_FEATURES_CACHE[token] = features
     return features
 
-@lru_cache(maxsize= 4096)
-def tokens2features(address):
+def tokens2features(address:Sequence[str]) -> List[Dict[str, Any]]:
     """
+    Build the CRF feature sequence for a sequence of tokens.
     """
-    feature_sequence = [tokenFeatures(address[0])]
-    previous_features = feature_sequence[-1].copy()
-
-    for token in address[1:]:
-        token_features = tokenFeatures(token)
+    # the token tuple is the cache key; tuples hash from their items' cached
+    # str hashes, which beats building and hashing a joined string
+    key = address if isinstance(address, tuple) else tuple(address)
+    cached = _FEATURE_SEQUENCE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # Each token gets one dict of its own; the next/previous entries point
+    # straight at the shared per-token dicts rather than at fresh copies.
+    shared_features = [_sharedTokenFeatures(token) for token in address]
+    last = len(shared_features) - 1
+
+    feature_sequence = []
+    for i, token_features in enumerate(shared_features):
         current_features = token_features.copy()
-
-        feature_sequence[-1]['next'] = current_features
-        token_features['previous'] = previous_features
-
-        feature_sequence.append(token_features)
-
-        previous_features = current_features
+        if i > 0:
+            current_features['previous'] = shared_features[i - 1]
+        if i < last:
+            current_features['next'] = shared_features[i + 1]
+        feature_sequence.append(current_features)
 
     feature_sequence[0]['address.start'] = True
     feature_sequence[-1]['address.end'] = True
 
-    if len(feature_sequence) > 1:
-        feature_sequence[1]['previous']['address.start'] = True
-        feature_sequence[-2]['next']['address.end'] = True
+    # Only the neighbours of the first and last tokens carry a boundary flag,
+    # so only those two need their own copy.
+    if last > 0:
+        feature_sequence[1]['previous'] = dict(shared_features[0], **{'address.start': True})
+        feature_sequence[-2]['next'] = dict(shared_features[-1], **{'address.end': True})
 
+    if len(_FEATURE_SEQUENCE_CACHE) < _FEATURE_SEQUENCE_CACHE_SIZE:
+        _FEATURE_SEQUENCE_CACHE[key] = feature_sequence
     return feature_sequence
 
-@lru_cache(maxsize= 1024)
-def digits(token:str):
+def digits(token:str) -> str:
     """
     Return an identifier specifying if the token contains digits.
     """
+    cached = _DIGITS_CACHE.get(token)
+    if cached is not None:
+        return cached
+
     if token.isdigit():
-        return 'all_digits'
-    elif set(token) & set(string.digits):
-        return 'some_digits'
+        result = 'all_digits'
+    elif not DIGITS.isdisjoint(token):
+        result = 'some_digits'
     else:
-        return 'no_digits'
+        result = 'no_digits'
+
+    if len(_DIGITS_CACHE) < _DIGITS_CACHE_SIZE:
+        _DIGITS_CACHE[token] = result
+    return result
+
+
+def hasPuncAfterFirst(token:str) -> bool:
+    """
+    Return whether any character after the first is neither a word character
+    nor a period, the same test as re.match(r'.+[^.\\w]', token).
+    """
+    # '.' never matches a newline, so a leading one leaves nothing for '.+'
+    if token.startswith('\n'):
+        return False
+    # str.isalnum() covers exactly the non-underscore half of the \w class
+    rest = token[1:].replace('.', '').replace('_', '')
+    return bool(rest) and not rest.isalnum()
 
 
-def trailingZeros(token:str):
+def trailingZeros(token:str) -> str:
     """
+    Return the run of zeros at the end of the token, if any.
     """
-    if not token.endswith("0"):
-        return ""
-    return re.findall(r'(0+)$', token)[0]
+    return token[len(token.rstrip("0")):]
 
 
 class RepeatedLabelError(probableparsing.RepeatedLabelError):